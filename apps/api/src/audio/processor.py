@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import subprocess
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
+import av
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +22,21 @@ class AudioProcessor:
     CHANNELS = 1  # Mono
     FORMAT = "wav"
 
+    # Probe only container headers - duration and stream dimensions live in
+    # the header, so there is no need to read/decode the default 5 MB / 5 s
+    PROBE_OPTIONS = {"probesize": "32", "analyzeduration": "0"}
+
+    # Returned when a video can't be probed
+    DEFAULT_METADATA = {
+        "duration": 0.0,
+        "width": 1920,
+        "height": 1080,
+        "fps": 30.0,
+    }
+
+    # Shared across instances so `ffmpeg -version` runs once per process
+    _ffmpeg_verified = False
+
     def __init__(self, temp_dir: str | None = None):
         """Initialize the audio processor.
 
@@ -23,14 +44,14 @@ class AudioProcessor:
             temp_dir: Directory for temporary files. Uses system temp if None.
         """
         self.temp_dir = temp_dir or tempfile.gettempdir()
-        self._ffmpeg_verified = False
 
     def _verify_ffmpeg(self) -> None:
         """Verify FFmpeg is installed and accessible.
 
-        This is called lazily when FFmpeg is actually needed.
+        This is called lazily when FFmpeg is actually needed. The result is
+        cached on the class, so verification happens once per process.
         """
-        if self._ffmpeg_verified:
+        if type(self)._ffmpeg_verified:
             return
 
         try:
@@ -41,7 +62,7 @@ class AudioProcessor:
                 check=True,
             )
             logger.debug(f"FFmpeg found: {result.stdout.split(chr(10))[0]}")
-            self._ffmpeg_verified = True
+            type(self)._ffmpeg_verified = True
         except FileNotFoundError as e:
             raise RuntimeError(
                 "FFmpeg not found. Please install FFmpeg and ensure it's "
@@ -57,48 +78,20 @@ class AudioProcessor:
 
     def extract_audio(
         self,
-        video_path: str | Path,
-        output_path: str | Path | None = None,
+        video_path: str | os.PathLike[str],
+        output_path: str | os.PathLike[str] | None = None,
     ) -> Path:
 
-        video_path = Path(video_path)
-        if not video_path.exists():
-            raise FileNotFoundError(f"Video file not found: {video_path}")
-
-        # Generate output path if not provided
-        if output_path is None:
-            output_path = Path(self.temp_dir) / f"{video_path.stem}_audio.wav"
-        else:
-            output_path = Path(output_path)
-
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        logger.info(f"Extracting audio from {video_path} to {output_path}")
+        video_path, output_path = self._prepare_extract(video_path, output_path)
 
         # Verify FFmpeg is available before using it
         self._verify_ffmpeg()
 
         try:
-            # FFmpeg command to extract and convert audio
-            cmd = [
-                "ffmpeg",
-                "-i",
-                str(video_path),
-                "-vn",  # No video
-                "-acodec",
-                "pcm_s16le",  # PCM 16-bit
-                "-ar",
-                str(self.SAMPLE_RATE),  # Sample rate
-                "-ac",
-                str(self.CHANNELS),  # Mono
-                "-y",  # Overwrite output
-                str(output_path),
-            ]
-
             subprocess.run(
-                cmd,
-                capture_output=True,
+                self._extract_audio_cmd(video_path, output_path),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
             )
@@ -113,49 +106,187 @@ class AudioProcessor:
             logger.error(f"FFmpeg error: {e.stderr}")
             raise RuntimeError(f"Audio extraction failed: {e.stderr}") from e
 
-    def get_audio_duration(self, audio_path: str | Path) -> float:
-        """Get the duration of an audio file in seconds.
+    async def aextract_audio(
+        self,
+        video_path: str | os.PathLike[str],
+        output_path: str | os.PathLike[str] | None = None,
+    ) -> Path:
+        """Extract audio from a video without blocking the event loop.
+
+        Async counterpart of extract_audio.
 
         Args:
-            audio_path: Path to the audio file.
+            video_path: Path to the video file.
+            output_path: Where to write the WAV. Generated in temp_dir if None.
 
         Returns:
-            Duration in seconds.
+            Path to the extracted audio file.
         """
-        audio_path = Path(audio_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        video_path, output_path = self._prepare_extract(video_path, output_path)
+
+        # Verify FFmpeg is available before using it (runs `ffmpeg -version`
+        # on first use, so keep it off the event loop)
+        await asyncio.to_thread(self._verify_ffmpeg)
+
+        proc = await asyncio.create_subprocess_exec(
+            *self._extract_audio_cmd(video_path, output_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            # Don't leave FFmpeg running, or a partial WAV nobody will delete
+            proc.kill()
+            await proc.wait()
+            output_path.unlink(missing_ok=True)
+            raise
+        if proc.returncode != 0:
+            error = stderr.decode(errors="replace")
+            logger.error(f"FFmpeg error: {error}")
+            raise RuntimeError(f"Audio extraction failed: {error}")
+
+        if not output_path.exists():
+            raise RuntimeError("Audio extraction failed: output file not created")
+
+        logger.info(f"Audio extracted successfully: {output_path}")
+        return output_path
+
+    def _prepare_extract(
+        self,
+        video_path: str | os.PathLike[str],
+        output_path: str | os.PathLike[str] | None,
+    ) -> tuple[str, Path]:
+        """Validate the input video and resolve the WAV output path."""
+        video_path = os.fspath(video_path)
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        # Generate output path if not provided
+        if output_path is None:
+            stem = os.path.splitext(os.path.basename(video_path))[0]
+            output_path = Path(self.temp_dir, f"{stem}_audio.wav")
+        else:
+            output_path = Path(output_path)
+
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Extracting audio from {video_path} to {output_path}")
+        return video_path, output_path
+
+    def _extract_audio_cmd(
+        self,
+        video_path: str,
+        output: str | Path,
+        fmt: str | None = None,
+    ) -> list[str]:
+        """Build the FFmpeg command to extract and convert audio.
+
+        Args:
+            video_path: Path to the video file.
+            output: Output file, or "-" for stdout.
+            fmt: Output format. Inferred from the output extension if None.
+
+        Returns:
+            FFmpeg argv.
+        """
+        cmd = [
+            "ffmpeg",
+            "-loglevel",
+            "error",  # Only report errors on stderr
+            "-nostats",  # No per-frame progress lines
+            "-i",
+            video_path,
+            "-vn",  # No video
+            "-acodec",
+            "pcm_s16le",  # PCM 16-bit
+            "-ar",
+            str(self.SAMPLE_RATE),  # Sample rate
+            "-ac",
+            str(self.CHANNELS),  # Mono
+        ]
+        if fmt is not None:
+            cmd += ["-f", fmt]
+        cmd += ["-y", str(output)]  # Overwrite output
+        return cmd
+
+    def extract_audio_stream(
+        self,
+        video_path: str | os.PathLike[str],
+        chunk_seconds: float = 30.0,
+    ) -> Iterator[np.ndarray]:
+        """Stream raw PCM audio from a video without writing a temp file.
+
+        FFmpeg writes 16-bit mono PCM at SAMPLE_RATE to stdout, which is read
+        back in fixed-size chunks.
+
+        Args:
+            video_path: Path to the video file.
+            chunk_seconds: Duration of audio per yielded chunk.
+
+        Yields:
+            1-D int16 arrays of samples. The last chunk may be shorter.
+
+        Raises:
+            FileNotFoundError: If video file doesn't exist.
+            RuntimeError: If FFmpeg exits with an error.
+        """
+        video_path = os.fspath(video_path)
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
 
         # Verify FFmpeg is available before using it
         self._verify_ffmpeg()
 
+        # Raw PCM with no container, written to stdout
+        cmd = self._extract_audio_cmd(video_path, "-", fmt="s16le")
+
+        # 2 bytes per sample; keep reads aligned to whole samples
+        chunk_bytes = int(self.SAMPLE_RATE * chunk_seconds) * 2 * self.CHANNELS
+
+        logger.info(f"Streaming audio from {video_path}")
+
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20,
+        )
         try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "csv=p=0",
-                str(audio_path),
-            ]
+            while buf := proc.stdout.read(chunk_bytes):
+                yield np.frombuffer(buf, dtype=np.int16)
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        if returncode != 0:
+            raise RuntimeError(f"Audio extraction failed: FFmpeg exited {returncode}")
+
+    def get_audio_duration(self, audio_path: str | os.PathLike[str]) -> float:
+        """Get the duration of an audio file in seconds.
+
+        Args:
+            audio_path: Path to the audio file.
 
-            duration = float(result.stdout.strip())
-            return duration
+        Returns:
+            Duration in seconds.
+        """
+        audio_path = os.fspath(audio_path)
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        try:
+            with self._open_container(audio_path) as container:
+                if container.duration is None:
+                    raise ValueError("container reports no duration")
+                return container.duration / av.time_base
 
-        except (subprocess.CalledProcessError, ValueError) as e:
+        except (av.FFmpegError, ValueError) as e:
             logger.error(f"Error getting audio duration: {e}")
             raise RuntimeError(f"Failed to get audio duration: {e}") from e
 
-    def get_duration(self, video_path: str | Path) -> float:
+    def get_duration(self, video_path: str | os.PathLike[str]) -> float:
         """Get the duration of a video file in seconds.
 
         Args:
@@ -167,7 +298,7 @@ class AudioProcessor:
         metadata = self.get_video_metadata(video_path)
         return metadata.get("duration", 0.0)
 
-    def get_video_metadata(self, video_path: str | Path) -> dict:
+    def get_video_metadata(self, video_path: str | os.PathLike[str]) -> dict:
         """Get metadata from a video file.
 
         Args:
@@ -176,58 +307,27 @@ class AudioProcessor:
         Returns:
             Dict with duration, width, height, fps.
         """
-        video_path = Path(video_path)
-        if not video_path.exists():
+        video_path = os.fspath(video_path)
+        if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
-        # Verify FFmpeg is available before using it
-        self._verify_ffmpeg()
-
         try:
-            # Get duration
-            duration_cmd = [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "csv=p=0",
-                str(video_path),
-            ]
-            duration_result = subprocess.run(
-                duration_cmd, capture_output=True, text=True, check=True
-            )
-            duration = float(duration_result.stdout.strip())
-
-            # Get video stream info (width, height, fps)
-            stream_cmd = [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-select_streams",
-                "v:0",
-                "-show_entries",
-                "stream=width,height,r_frame_rate",
-                "-of",
-                "csv=p=0",
-                str(video_path),
-            ]
-            stream_result = subprocess.run(
-                stream_cmd, capture_output=True, text=True, check=True
-            )
-
-            parts = stream_result.stdout.strip().split(",")
-            width = int(parts[0]) if len(parts) > 0 else 1920
-            height = int(parts[1]) if len(parts) > 1 else 1080
-
-            # Parse frame rate (could be "30/1" or "29.97")
-            fps_str = parts[2] if len(parts) > 2 else "30/1"
-            if "/" in fps_str:
-                num, den = fps_str.split("/")
-                fps = float(num) / float(den)
-            else:
-                fps = float(fps_str)
+            with self._open_container(video_path) as container:
+                duration = (
+                    container.duration / av.time_base
+                    if container.duration is not None
+                    else 0.0
+                )
+                if not container.streams.video:
+                    return {**self.DEFAULT_METADATA, "duration": duration}
+
+                stream = container.streams.video[0]
+                width = stream.codec_context.width or 1920
+                height = stream.codec_context.height or 1080
+                # With a minimal probe, variable-fps streams may not report
+                # an average rate
+                rate = stream.average_rate
+                fps = float(rate) if rate else 30.0
 
             return {
                 "duration": duration,
@@ -236,26 +336,53 @@ class AudioProcessor:
                 "fps": fps,
             }
 
-        except (subprocess.CalledProcessError, ValueError, IndexError) as e:
+        except av.FFmpegError as e:
             logger.error(f"Error getting video metadata: {e}")
             # Return defaults on error
-            return {
-                "duration": 0.0,
-                "width": 1920,
-                "height": 1080,
-                "fps": 30.0,
-            }
+            return dict(self.DEFAULT_METADATA)
+
+    async def aget_video_metadata(self, video_path: str | os.PathLike[str]) -> dict:
+        """Get metadata from a video file without blocking the event loop.
+
+        Async counterpart of get_video_metadata.
+
+        Args:
+            video_path: Path to the video file.
+
+        Returns:
+            Dict with duration, width, height, fps.
+        """
+        return await asyncio.to_thread(self.get_video_metadata, video_path)
+
+    async def batch_metadata(
+        self, video_paths: list[str | os.PathLike[str]]
+    ) -> list[dict]:
+        """Get metadata for several video files concurrently.
+
+        Args:
+            video_paths: Paths to the video files.
+
+        Returns:
+            Metadata dicts in the same order as video_paths.
+        """
+        return await asyncio.gather(
+            *(self.aget_video_metadata(path) for path in video_paths)
+        )
+
+    def _open_container(self, path: str) -> av.container.InputContainer:
+        """Open a media file in-process with libavformat, probing headers only."""
+        return av.open(path, options=self.PROBE_OPTIONS, metadata_errors="ignore")
 
-    def cleanup(self, file_path: str | Path) -> None:
+    def cleanup(self, file_path: str | os.PathLike[str]) -> None:
         """Remove a temporary file.
 
         Args:
             file_path: Path to the file to remove.
         """
         try:
-            path = Path(file_path)
-            if path.exists():
-                path.unlink()
+            path = os.fspath(file_path)
+            if os.path.exists(path):
+                os.unlink(path)
                 logger.debug(f"Cleaned up: {path}")
         except OSError as e:
             logger.warning(f"Failed to cleanup {file_path}: {e}")
@@ -0,0 +1,41 @@
+"""Shared spaCy model loading for caption processing."""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def load_spacy_model(model_name: str, disabled: tuple[str, ...] = ()) -> Language:
+    """Load a spaCy model once per process.
+
+    Models are cached by name and disabled components, so every segmenter
+    and stylizer with the same configuration shares one loaded pipeline.
+    spaCy itself is imported here so endpoints that never process captions
+    don't pay its import cost.
+
+    Args:
+        model_name: spaCy model to load (downloaded if missing).
+        disabled: Pipeline components to disable.
+
+    Returns:
+        Loaded spaCy Language pipeline.
+    """
+    import spacy
+
+    logger.info(f"Loading spaCy model: {model_name}")
+    try:
+        nlp = spacy.load(model_name, disable=disabled)
+    except OSError:
+        logger.warning(f"Model {model_name} not found, downloading...")
+        spacy.cli.download(model_name)
+        nlp = spacy.load(model_name, disable=disabled)
+    logger.info("spaCy model loaded successfully")
+    return nlp
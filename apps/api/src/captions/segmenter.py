@@ -1,23 +1,32 @@
 """Caption segmentation - convert transcript to lyric-style phrases."""
 
+from __future__ import annotations
+
 import logging
 import uuid
+from typing import TYPE_CHECKING
 
-import spacy
-from spacy.language import Language
+import numpy as np
 
 from ..models import (
+    STYLE_NORMAL,
     Caption,
     CaptionAnimation,
     CaptionPositionCoords,
-    CaptionStyle,
     CaptionWord,
     Transcript,
     TranscriptWord,
 )
+from .nlp import load_spacy_model
+
+if TYPE_CHECKING:
+    from spacy.language import Language
 
 logger = logging.getLogger(__name__)
 
+# Sentence-ending punctuation ("..." is covered by ".")
+_SENT_END = frozenset(".!?")
+
 
 class CaptionSegmenter:
     """Segment transcripts into lyric-style caption phrases."""
@@ -27,12 +36,18 @@ class CaptionSegmenter:
     DEFAULT_MIN_WORDS = 2
     DEFAULT_MAX_CHARS_PER_LINE = 30
 
+    # Pipeline components not needed for POS tagging. attribute_ruler stays
+    # enabled: English models use it to map fine-grained tags to token.pos_
+    DISABLED_PIPES = ("parser", "ner", "lemmatizer")
+
     # Pause threshold in seconds - if gap between words is larger, start new
     # caption
     PAUSE_THRESHOLD = 0.5
 
     # Words that are better at the start of a line
     LINE_START_WORDS = {"and", "but", "or", "so", "then", "when", "if", "that"}
+    # First letters of LINE_START_WORDS, checked before lowercasing a word
+    LINE_START_CHARS = frozenset(w[0] for w in LINE_START_WORDS)
 
     def __init__(
         self,
@@ -59,28 +74,24 @@ class CaptionSegmenter:
 
     @property
     def nlp(self) -> Language:
-        """Lazy-load the spaCy model."""
+        """Lazy-load the spaCy model (shared across instances)."""
         if self._nlp is None:
-            logger.info(f"Loading spaCy model: {self.model_name}")
-            try:
-                self._nlp = spacy.load(self.model_name)
-            except OSError:
-                logger.warning(f"Model {self.model_name} not found, downloading...")
-                spacy.cli.download(self.model_name)
-                self._nlp = spacy.load(self.model_name)
-            logger.info("spaCy model loaded successfully")
+            self._nlp = load_spacy_model(self.model_name, self.DISABLED_PIPES)
         return self._nlp
 
     def segment(
         self,
         transcript: Transcript,
         default_animation: CaptionAnimation = CaptionAnimation.SCALE_IN,
+        max_words: int | None = None,
     ) -> list[Caption]:
         """Segment a transcript into caption phrases.
 
         Args:
             transcript: Input transcript with word-level timestamps.
             default_animation: Default animation style for captions.
+            max_words: Maximum words per caption for this call only.
+                Defaults to self.max_words.
 
         Returns:
             List of Caption objects.
@@ -91,7 +102,12 @@ class CaptionSegmenter:
         logger.info(f"Segmenting {len(transcript.words)} words into captions")
 
         # Group words into phrases
-        phrases = self._group_into_phrases(transcript.words)
+        phrases = self._group_into_phrases(
+            transcript.words, self.max_words if max_words is None else max_words
+        )
+
+        # One random suffix per job; the index keeps IDs unique within it
+        job_id = uuid.uuid4().hex[:8]
 
         # Convert phrases to captions
         captions = []
@@ -99,6 +115,7 @@ class CaptionSegmenter:
             caption = self._create_caption(
                 words=phrase_words,
                 index=i,
+                job_id=job_id,
                 default_animation=default_animation,
             )
             captions.append(caption)
@@ -109,6 +126,7 @@ class CaptionSegmenter:
     def _group_into_phrases(
         self,
         words: list[TranscriptWord],
+        max_words: int,
     ) -> list[list[TranscriptWord]]:
         """Group words into natural phrases.
 
@@ -120,6 +138,7 @@ class CaptionSegmenter:
 
         Args:
             words: List of transcript words.
+            max_words: Maximum words per phrase.
 
         Returns:
             List of word groups (phrases).
@@ -127,78 +146,72 @@ class CaptionSegmenter:
         if not words:
             return []
 
-        phrases = []
-        current_phrase: list[TranscriptWord] = []
-
-        for _i, word in enumerate(words):
-            # Check for natural break points
-            should_break = False
-
-            if current_phrase:
-                # Check for pause between words
-                prev_word = current_phrase[-1]
-                gap = word.start - prev_word.end
-                if gap > self.PAUSE_THRESHOLD:
-                    should_break = True
-
-                # Check for max words
-                if len(current_phrase) >= self.max_words:
-                    should_break = True
-
-                # Check for sentence-ending punctuation
-                if self._ends_with_punctuation(prev_word.text):
-                    should_break = True
-
-            if should_break and current_phrase:
-                phrases.append(current_phrase)
-                current_phrase = []
+        n = len(words)
+
+        # Find natural break points up front with vectorized ops: a new
+        # phrase starts after a pause between words or after sentence-ending
+        # punctuation
+        starts = np.fromiter((w.start for w in words), dtype=np.float64, count=n)
+        ends = np.fromiter((w.end for w in words), dtype=np.float64, count=n)
+        ends_with_punctuation = self._ends_with_punctuation
+        breaks = starts[1:] - ends[:-1] > self.PAUSE_THRESHOLD
+        breaks |= np.fromiter(
+            (ends_with_punctuation(w.text) for w in words[:-1]),
+            dtype=np.bool_,
+            count=n - 1,
+        )
+        bounds = [0, *(np.flatnonzero(breaks) + 1).tolist(), n]
 
-            current_phrase.append(word)
+        phrases: list[list[TranscriptWord]] = []
+        # Last closed phrase, held back until we know whether it merges with
+        # the phrase after it
+        pending: list[TranscriptWord] | None = None
 
-        # Don't forget the last phrase
-        if current_phrase:
-            phrases.append(current_phrase)
+        # Split each run between break points by maximum word count
+        step = max(max_words, 1)
+        for lo, hi in zip(bounds, bounds[1:], strict=False):
+            for i in range(lo, hi, step):
+                phrase = words[i : min(i + step, hi)]
+                pending = self._close_phrase(phrases, pending, phrase, max_words)
 
-        # Merge very short phrases with neighbors
-        phrases = self._merge_short_phrases(phrases)
+        if pending:
+            phrases.append(pending)
 
         return phrases
 
-    def _merge_short_phrases(
+    def _close_phrase(
         self,
         phrases: list[list[TranscriptWord]],
-    ) -> list[list[TranscriptWord]]:
-        """Merge very short phrases with neighboring phrases.
+        pending: list[TranscriptWord] | None,
+        phrase: list[TranscriptWord],
+        max_words: int,
+    ) -> list[TranscriptWord] | None:
+        """Merge very short phrases with the phrase that follows them.
+
+        Called as each phrase closes, so grouping and merging happen in a
+        single pass over the words.
 
         Args:
-            phrases: List of word groups.
+            phrases: Output list of finished phrases (appended to in place).
+            pending: Previously closed phrase not yet emitted, if any.
+            phrase: The phrase that just closed.
+            max_words: Maximum words per phrase.
 
         Returns:
-            Merged list with fewer tiny phrases.
+            The new pending phrase, or None if pending and phrase were merged.
         """
-        if len(phrases) <= 1:
-            return phrases
+        if pending is None:
+            return phrase
 
-        merged = []
-        i = 0
+        # Merge if pending is too short and combined length is acceptable
+        pending_len = len(pending)
+        if pending_len < self.min_words and pending_len + len(phrase) <= max_words + 1:
+            pending.extend(phrase)
+            phrases.append(pending)
+            return None
 
-        while i < len(phrases):
-            current = phrases[i]
-
-            # If current phrase is too short and there's a next phrase
-            if len(current) < self.min_words and i + 1 < len(phrases):
-                next_phrase = phrases[i + 1]
-
-                # Merge if combined length is acceptable
-                if len(current) + len(next_phrase) <= self.max_words + 1:
-                    merged.append(current + next_phrase)
-                    i += 2
-                    continue
-
-            merged.append(current)
-            i += 1
-
-        return merged
+        phrases.append(pending)
+        return phrase
 
     def _ends_with_punctuation(self, text: str) -> bool:
         """Check if text ends with sentence-ending punctuation.
@@ -209,13 +222,14 @@ class CaptionSegmenter:
         Returns:
             True if ends with sentence punctuation.
         """
-        text = text.strip()
-        return text.endswith((".", "!", "?", "..."))
+        text = text.rstrip()
+        return bool(text) and text[-1] in _SENT_END
 
     def _create_caption(
         self,
         words: list[TranscriptWord],
         index: int,
+        job_id: str,
         default_animation: CaptionAnimation,
     ) -> Caption:
         """Create a Caption object from a group of words.
@@ -223,6 +237,7 @@ class CaptionSegmenter:
         Args:
             words: Words in this caption.
             index: Caption index (for ID generation).
+            job_id: Suffix shared by all captions from one segment() call.
             default_animation: Animation style to use.
 
         Returns:
@@ -232,7 +247,7 @@ class CaptionSegmenter:
         caption_words = self._apply_line_wrapping(words)
 
         # Build full text
-        text = " ".join(w.text for w in words)
+        text = " ".join([w.text for w in words])
 
         # Count lines
         line_count = 1 + sum(1 for w in caption_words if w.lineBreakBefore)
@@ -242,13 +257,13 @@ class CaptionSegmenter:
         end = words[-1].end
 
         return Caption(
-            id=f"caption_{index}_{uuid.uuid4().hex[:8]}",
+            id=f"caption_{index}_{job_id}",
             text=text,
             start=start,
             end=end,
             words=caption_words,
             emphasis=[],  # Will be filled by stylizer
-            style=CaptionStyle.NORMAL,
+            style=STYLE_NORMAL,
             animation=default_animation,
             position=CaptionPositionCoords(x=50, y=50),  # Center by default
             maxCharsPerLine=self.max_chars_per_line,
@@ -266,10 +281,35 @@ class CaptionSegmenter:
 
         Returns:
             List of CaptionWord objects with lineBreakBefore set.
+            Built with model_construct: the word fields come from
+            already-validated TranscriptWords, so they are not re-validated.
         """
         if not words:
             return []
 
+        # Bind loop-invariant attributes to locals
+        max_chars = self.max_chars_per_line
+        start_word_chars = max_chars * 0.5
+        comma_break_chars = max_chars * 0.6
+        start_words = self.LINE_START_WORDS
+        start_chars = self.LINE_START_CHARS
+
+        # Fast path for the common case: the caption fits on one line and has
+        # no line-start word or comma that could force an early break
+        total_chars = sum([len(w.text) for w in words]) + len(words) - 1
+        if (
+            total_chars <= max_chars
+            and not any(
+                w.text[:1].lower() in start_chars and w.text.lower() in start_words
+                for w in words[1:]
+            )
+            and not any(w.text.endswith(",") for w in words[:-1])
+        ):
+            return [
+                CaptionWord.model_construct(text=w.text, start=w.start, end=w.end)
+                for w in words
+            ]
+
         caption_words: list[CaptionWord] = []
         current_line_chars = 0
 
@@ -283,19 +323,20 @@ class CaptionSegmenter:
             # - Is this a good word to start a new line?
             # - Break after commas if line is getting long
             if i > 0 and (
-                current_line_chars + 1 + word_len > self.max_chars_per_line
+                current_line_chars + 1 + word_len > max_chars
                 or (
-                    current_line_chars > self.max_chars_per_line * 0.5
-                    and word.text.lower() in self.LINE_START_WORDS
+                    current_line_chars > start_word_chars
+                    and word.text[:1].lower() in start_chars
+                    and word.text.lower() in start_words
                 )
                 or (
-                    current_line_chars > self.max_chars_per_line * 0.6
+                    current_line_chars > comma_break_chars
                     and words[i - 1].text.endswith(",")
                 )
             ):
                 needs_break = True
 
-            caption_word = CaptionWord(
+            caption_word = CaptionWord.model_construct(
                 text=word.text,
                 start=word.start,
                 end=word.end,
@@ -321,3 +362,22 @@ class CaptionSegmenter:
         """
         doc = self.nlp(text)
         return [(token.text, token.pos_) for token in doc]
+
+    def get_word_pos_tags_batch(
+        self,
+        texts: list[str],
+        batch_size: int = 64,
+    ) -> list[list[tuple[str, str]]]:
+        """Get part-of-speech tags for many texts in one pipeline pass.
+
+        Args:
+            texts: Texts to analyze.
+            batch_size: Number of texts spaCy processes per batch.
+
+        Returns:
+            One list of (word, POS tag) tuples per input text.
+        """
+        return [
+            [(token.text, token.pos_) for token in doc]
+            for doc in self.nlp.pipe(texts, batch_size=batch_size)
+        ]
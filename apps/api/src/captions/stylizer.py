@@ -1,28 +1,109 @@
 """Caption stylization - add emphasis, animations, and visual styles."""
 
-import logging
+from __future__ import annotations
 
-import spacy
-from spacy.language import Language
+import logging
+import string
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, ClassVar
 
 from ..models import (
+    ANIMATION_WORD_BY_WORD,
+    STYLE_BOLD,
+    STYLE_HIGHLIGHT,
+    STYLE_ITALIC,
+    STYLE_NORMAL,
     Caption,
-    CaptionAnimation,
     CaptionPositionCoords,
     Captions,
     CaptionSettings,
-    CaptionStyle,
     CaptionWord,
 )
+from .nlp import load_spacy_model
+
+if TYPE_CHECKING:
+    from spacy.language import Language
 
 logger = logging.getLogger(__name__)
 
+# (token text, POS tag) pairs for one caption text
+PosTags = tuple[tuple[str, str], ...]
+
+# Common English function words that never get lexical emphasis. Entries are
+# lowercase with apostrophes removed, matching the lookup key in
+# CaptionStylizer._find_lexical_emphasis.
+_STOPWORDS_TEXT = """
+    a about above after again against all also am an and any are arent as at be
+    because been before being below between both but by can cant could couldnt
+    did didnt do does doesnt doing dont down during each even ever every few
+    for from further get gets go goes going gonna got gotta had hadnt has hasnt
+    have havent having he hed her here heres hers herself hes him himself
+    his how hows i id if ill im in into is isnt it its itself ive just kind
+    kinda know let lets like make many may me might more most much must my
+    myself no nor not now of off okay on once one only or other ought our ours
+    ourselves out over own really right same say said she shed shes
+    should shouldnt so some such than that thats the their theirs them
+    themselves then there theres these they theyd theyll theyre theyve thing
+    things think this those though through to too um uh under until up us very
+    wanna was wasnt we wed well were werent weve what whats when whens where
+    wheres which while who whom whos why whys will with wont would wouldnt yeah
+    yes you youd youll your youre yours yourself yourselves youve
+"""
+STOPWORDS = frozenset(_STOPWORDS_TEXT.split())
+
+# Deletes punctuation when building the stopword lookup key, including the
+# curly quotes and apostrophes in contractions like "don’t", and the em dash
+_STRIP_PUNCT = str.maketrans(
+    "", "", string.punctuation + "\u2018\u2019\u201c\u201d\u2014"
+)
+
+# Punctuation stripped from the end of a word before matching or emphasizing
+# it, including the curly quotes and em dash that transcripts often contain
+_TRAILING_PUNCT = ".,!?;:\"')\u201d\u2019\u2014"
+
+# Predefined caption themes for CaptionStylizer.apply_theme, built once at import
+_THEMES: dict[str, CaptionSettings] = {
+    "default": CaptionSettings(
+        fontFamily="Inter",
+        fontSize=48,
+        fontWeight=700,
+        color="#FFFFFF",
+        emphasisScale=1.2,
+    ),
+    "minimal": CaptionSettings(
+        fontFamily="Helvetica",
+        fontSize=40,
+        fontWeight=400,
+        color="#FFFFFF",
+        emphasisScale=1.1,
+    ),
+    "bold": CaptionSettings(
+        fontFamily="Impact",
+        fontSize=56,
+        fontWeight=900,
+        color="#FFFFFF",
+        emphasisScale=1.3,
+    ),
+    "playful": CaptionSettings(
+        fontFamily="Comic Sans MS",
+        fontSize=44,
+        fontWeight=700,
+        color="#FFFF00",
+        emphasisScale=1.4,
+    ),
+}
+
 
 class CaptionStylizer:
     """Apply visual styles and emphasis to captions."""
 
     DEFAULT_MODEL = "en_core_web_sm"
 
+    # Only token.pos_ is used. attribute_ruler stays enabled: English models
+    # use it to map fine-grained tags to token.pos_
+    DISABLED_PIPES = ("parser", "ner", "lemmatizer")
+
     # POS tags for words that are good candidates for emphasis
     EMPHASIS_POS_TAGS = {"NOUN", "VERB", "ADJ", "ADV", "PROPN"}
 
@@ -38,35 +119,55 @@ class CaptionStylizer:
         "NUM": 1.15,  # Numbers - medium-large
     }
 
+    # Number of caption texts spaCy processes per batch in stylize()
+    NLP_BATCH_SIZE = 64
+
+    # Number of caption texts whose POS tags are kept for reuse; restyling
+    # the same transcript (or repeated short phrases) skips spaCy entirely
+    POS_CACHE_SIZE = 4096
+
+    # Lexical emphasis: minimum length of a non-stopword candidate
+    MIN_EMPHASIS_WORD_LEN = 4
+
     # Default position - center of screen
     DEFAULT_POSITION = {"x": 50, "y": 50}
 
+    # Styles for captions ending in a question mark or exclamation mark
+    END_PUNCT_STYLES = {"?": STYLE_ITALIC, "!": STYLE_BOLD}
+
     # Single animation style - word by word reveal
-    DEFAULT_ANIMATION = CaptionAnimation.WORD_BY_WORD
+    DEFAULT_ANIMATION = ANIMATION_WORD_BY_WORD
+
+    # Settings for stylize() results; built once, and each result gets a
+    # copy so editing one result's settings doesn't change the others
+    _DEFAULT_SETTINGS: ClassVar[CaptionSettings] = CaptionSettings()
 
-    def __init__(self, model_name: str | None = None):
+    def __init__(self, model_name: str | None = None, use_nlp: bool = False):
         """Initialize the caption stylizer.
 
         Args:
             model_name: spaCy model to use for NLP analysis.
+            use_nlp: Use spaCy POS tags for emphasis and font size variation.
+                When False (default), emphasis comes from a stopword filter
+                and spaCy is never loaded.
         """
         self.model_name = model_name or self.DEFAULT_MODEL
+        self.use_nlp = use_nlp
         self._nlp: Language | None = None
+        self._pos_cache: OrderedDict[str, PosTags] = OrderedDict()
+        self._pos_cache_lock = threading.Lock()
 
     @property
     def nlp(self) -> Language:
-        """Lazy-load the spaCy model."""
+        """Lazy-load the spaCy model (shared across instances)."""
         if self._nlp is None:
-            logger.info(f"Loading spaCy model: {self.model_name}")
-            try:
-                self._nlp = spacy.load(self.model_name)
-            except OSError:
-                logger.warning(f"Model {self.model_name} not found, downloading...")
-                spacy.cli.download(self.model_name)
-                self._nlp = spacy.load(self.model_name)
-            logger.info("spaCy model loaded successfully")
+            self._nlp = load_spacy_model(self.model_name, self.DISABLED_PIPES)
         return self._nlp
 
+    def warmup(self) -> None:
+        """Load the spaCy model and run it once, ahead of the first request."""
+        self.nlp("warmup")
+
     def stylize(
         self,
         captions: list[Caption],
@@ -83,32 +184,67 @@ class CaptionStylizer:
         """
         logger.info(f"Stylizing {len(captions)} captions")
 
-        styled_captions = []
-        for i, caption in enumerate(captions):
-            styled = self._stylize_caption(
+        if self.use_nlp:
+            all_pos_tags = self._get_pos_tags([caption.text for caption in captions])
+        else:
+            all_pos_tags = [None] * len(captions)
+
+        styled_captions = [
+            self._stylize_caption(
                 caption=caption,
-                index=i,
+                pos_tags=pos_tags,
                 emphasize_keywords=emphasize_keywords,
             )
-            styled_captions.append(styled)
+            for caption, pos_tags in zip(captions, all_pos_tags, strict=True)
+        ]
 
-        return Captions(
+        # Styled captions are already valid, so skip revalidating them
+        return Captions.model_construct(
             version="1.0",
             captions=styled_captions,
-            settings=CaptionSettings(),
+            settings=self._DEFAULT_SETTINGS.model_copy(),
         )
 
+    def _get_pos_tags(self, texts: list[str]) -> list[PosTags]:
+        """Get POS tags for caption texts, using the LRU cache where possible.
+
+        Texts not in the cache go through spaCy in one batched pass.
+
+        Args:
+            texts: Caption texts to tag.
+
+        Returns:
+            (token text, POS tag) pairs for each input text.
+        """
+        cache = self._pos_cache
+        with self._pos_cache_lock:
+            tagged = {text: cache[text] for text in texts if text in cache}
+        misses = [text for text in dict.fromkeys(texts) if text not in tagged]
+
+        if misses:
+            docs = self.nlp.pipe(misses, batch_size=self.NLP_BATCH_SIZE)
+            for text, doc in zip(misses, docs, strict=True):
+                tagged[text] = tuple((token.text, token.pos_) for token in doc)
+
+        with self._pos_cache_lock:
+            for text in texts:
+                cache[text] = tagged[text]
+                cache.move_to_end(text)
+            while len(cache) > self.POS_CACHE_SIZE:
+                cache.popitem(last=False)
+        return [tagged[text] for text in texts]
+
     def _stylize_caption(
         self,
         caption: Caption,
-        index: int,
+        pos_tags: PosTags | None,
         emphasize_keywords: bool,
     ) -> Caption:
         """Apply styling to a single caption.
 
         Args:
             caption: Caption to style.
-            index: Caption index.
+            pos_tags: POS tags of the caption text, or None without NLP.
             emphasize_keywords: Whether to add emphasis.
 
         Returns:
@@ -117,10 +253,10 @@ class CaptionStylizer:
         # Find emphasis words
         emphasis = []
         if emphasize_keywords:
-            emphasis = self._find_emphasis_words(caption)
+            emphasis = self._find_emphasis_words(caption, pos_tags)
 
         # Apply font size variation to words
-        styled_words = self._apply_font_size_variation(caption, emphasis)
+        styled_words = self._apply_font_size_variation(caption, pos_tags, emphasis)
 
         # Always use word-by-word animation
         animation = self.DEFAULT_ANIMATION
@@ -133,30 +269,28 @@ class CaptionStylizer:
             x=self.DEFAULT_POSITION["x"], y=self.DEFAULT_POSITION["y"]
         )
 
-        # Create new caption with styling
-        return Caption(
-            id=caption.id,
-            text=caption.text,
-            start=caption.start,
-            end=caption.end,
-            words=styled_words,
-            emphasis=emphasis,
-            style=style,
-            animation=animation,
-            position=position,
-            maxCharsPerLine=caption.maxCharsPerLine,
-            lineCount=caption.lineCount,
+        # Copy the caption with styling; the input is already validated
+        return caption.model_copy(
+            update={
+                "words": styled_words,
+                "emphasis": emphasis,
+                "style": style,
+                "animation": animation,
+                "position": position,
+            }
         )
 
     def _apply_font_size_variation(
         self,
         caption: Caption,
+        pos_tags: PosTags | None,
         emphasis: list[str],
     ) -> list[CaptionWord]:
         """Apply font size variation to words based on POS and emphasis.
 
         Args:
             caption: Caption with words to style.
+            pos_tags: POS tags of the caption text, or None without NLP.
             emphasis: List of emphasized words.
 
         Returns:
@@ -165,39 +299,34 @@ class CaptionStylizer:
         if not caption.words:
             return []
 
-        # Analyze with spaCy
-        doc = self.nlp(caption.text)
-
         # Create a mapping of word positions to POS tags
         word_pos_map: dict[int, str] = {}
-        doc_word_idx = 0
-        for i, word in enumerate(caption.words):
-            # Find matching token in spaCy doc
-            for j in range(doc_word_idx, len(doc)):
-                token = doc[j]
-                if token.text.lower() == word.text.lower().rstrip(".,!?"):
-                    word_pos_map[i] = token.pos_
-                    doc_word_idx = j + 1
-                    break
+        if pos_tags is not None:
+            tag_idx = 0
+            for i, word in enumerate(caption.words):
+                # Find matching token in the tagged text
+                for j in range(tag_idx, len(pos_tags)):
+                    token_text, pos = pos_tags[j]
+                    if token_text.lower() == word.text.lower().rstrip(_TRAILING_PUNCT):
+                        word_pos_map[i] = pos
+                        tag_idx = j + 1
+                        break
 
         styled_words = []
         num_words = len(caption.words)
+        emphasis_set = {e.lower() for e in emphasis}
+        pos_multipliers = self.POS_FONT_MULTIPLIERS
 
         for i, word in enumerate(caption.words):
-            multiplier = 1.0
-
             # Check if this word is in emphasis list
-            clean_word = word.text.lower().rstrip(".,!?")
-            is_emphasized = any(e.lower() == clean_word for e in emphasis)
+            clean_word = word.text.lower().rstrip(_TRAILING_PUNCT)
 
-            if is_emphasized:
+            if clean_word in emphasis_set:
                 # Emphasized words get a dramatic size boost
                 multiplier = 1.4
             else:
                 # Apply POS-based variation
-                pos = word_pos_map.get(i, "")
-                if pos in self.POS_FONT_MULTIPLIERS:
-                    multiplier = self.POS_FONT_MULTIPLIERS[pos]
+                multiplier = pos_multipliers.get(word_pos_map.get(i, ""), 1.0)
 
             # First and last words of caption get a slight boost
             if num_words > 2:
@@ -217,51 +346,78 @@ class CaptionStylizer:
 
         return styled_words
 
-    def _find_emphasis_words(self, caption: Caption) -> list[str]:
+    def _find_emphasis_words(
+        self, caption: Caption, pos_tags: PosTags | None
+    ) -> list[str]:
         """Find words to emphasize in a caption.
 
-        Uses NLP to identify important words (nouns, verbs, adjectives).
-        Also considers position (last word often emphasized in lyrics).
+        With NLP, picks important words (nouns, verbs, adjectives) by POS.
+        Without it, picks words that are not stopwords and have at least
+        MIN_EMPHASIS_WORD_LEN letters. Also considers position (last word
+        often emphasized in lyrics).
 
         Args:
             caption: Caption to analyze.
+            pos_tags: POS tags of the caption text, or None without NLP.
 
         Returns:
             List of words to emphasize.
         """
-        if not caption.words:
-            return []
-
-        # Analyze with spaCy
-        doc = self.nlp(caption.text)
+        # A lone word is always the emphasis target (after the POS match or
+        # the last-word fallback), so skip the analysis
+        if len(caption.words) <= 1:
+            clean_word = (
+                caption.words[0].text.rstrip(_TRAILING_PUNCT) if caption.words else ""
+            )
+            return [clean_word] if clean_word else []
 
-        emphasis = []
-        word_texts = [w.text.lower() for w in caption.words]
+        if pos_tags is None:
+            emphasis = self._find_lexical_emphasis(caption)
+        else:
+            emphasis = []
+            word_set = {w.text.lower() for w in caption.words}
+            emphasis_pos = self.EMPHASIS_POS_TAGS
 
-        for token in doc:
-            # Check if this is an emphasis-worthy POS
-            if token.pos_ in self.EMPHASIS_POS_TAGS:
-                # Find matching word in caption
-                token_lower = token.text.lower()
-                if token_lower in word_texts:
-                    emphasis.append(token.text)
+            for token_text, pos in pos_tags:
+                # Emphasis-worthy POS that matches a word in the caption
+                if pos in emphasis_pos and token_text.lower() in word_set:
+                    emphasis.append(token_text)
 
         # If no emphasis found, emphasize the last word (lyric style)
         if not emphasis and caption.words:
             last_word = caption.words[-1].text
             # Clean punctuation
-            clean_word = last_word.rstrip(".,!?")
+            clean_word = last_word.rstrip(_TRAILING_PUNCT)
             if clean_word:
                 emphasis.append(clean_word)
 
-        # Limit to 1-2 emphasis words per caption for clean look
-        return emphasis[:2]
+        # Drop repeats (keeping order), then limit to 1-2 emphasis words
+        # per caption for clean look
+        return list(dict.fromkeys(emphasis))[:2]
+
+    def _find_lexical_emphasis(self, caption: Caption) -> list[str]:
+        """Find emphasis candidates without NLP.
+
+        Args:
+            caption: Caption to analyze.
+
+        Returns:
+            Up to two words that are not stopwords and are long enough.
+        """
+        emphasis: dict[str, None] = {}
+        for word in caption.words:
+            key = word.text.lower().translate(_STRIP_PUNCT)
+            if len(key) >= self.MIN_EMPHASIS_WORD_LEN and key not in STOPWORDS:
+                emphasis[word.text.rstrip(_TRAILING_PUNCT)] = None
+                if len(emphasis) == 2:
+                    break
+        return list(emphasis)
 
     def _select_style(
         self,
         caption: Caption,
         emphasis: list[str],
-    ) -> CaptionStyle:
+    ) -> str:
         """Select visual style for a caption.
 
         Args:
@@ -269,26 +425,23 @@ class CaptionStylizer:
             emphasis: Emphasis words (may influence style).
 
         Returns:
-            Selected style.
+            Selected style (a CaptionStyle value).
         """
-        # Questions get italic style
-        if caption.text.strip().endswith("?"):
-            return CaptionStyle.ITALIC
-
-        # Exclamations get bold style
-        if caption.text.strip().endswith("!"):
-            return CaptionStyle.BOLD
+        # Questions and exclamations are styled by their final character
+        style = self.END_PUNCT_STYLES.get(caption.text.rstrip()[-1:])
+        if style is not None:
+            return style
 
         # Short, punchy captions (1-2 words) get bold
         if len(caption.words) <= 2:
-            return CaptionStyle.BOLD
+            return STYLE_BOLD
 
         # Captions with multiple emphasis words get highlight
         if len(emphasis) >= 2:
-            return CaptionStyle.HIGHLIGHT
+            return STYLE_HIGHLIGHT
 
         # Default to normal
-        return CaptionStyle.NORMAL
+        return STYLE_NORMAL
 
     def apply_theme(
         self,
@@ -304,38 +457,8 @@ class CaptionStylizer:
         Returns:
             Captions with theme-based settings.
         """
-        themes = {
-            "default": CaptionSettings(
-                fontFamily="Inter",
-                fontSize=48,
-                fontWeight=700,
-                color="#FFFFFF",
-                emphasisScale=1.2,
-            ),
-            "minimal": CaptionSettings(
-                fontFamily="Helvetica",
-                fontSize=40,
-                fontWeight=400,
-                color="#FFFFFF",
-                emphasisScale=1.1,
-            ),
-            "bold": CaptionSettings(
-                fontFamily="Impact",
-                fontSize=56,
-                fontWeight=900,
-                color="#FFFFFF",
-                emphasisScale=1.3,
-            ),
-            "playful": CaptionSettings(
-                fontFamily="Comic Sans MS",
-                fontSize=44,
-                fontWeight=700,
-                color="#FFFF00",
-                emphasisScale=1.4,
-            ),
-        }
-
-        settings = themes.get(theme, themes["default"])
+        # Copy so callers editing the result can't change the shared theme
+        settings = _THEMES.get(theme, _THEMES["default"]).model_copy()
 
         return Captions(
             version=captions.version,
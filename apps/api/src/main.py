@@ -1,8 +1,10 @@
+import asyncio
 import logging
 import os
+import re
+import secrets
 import tempfile
 import time
-import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -20,6 +22,7 @@ from .models import (
     ProcessResponse,
     TranscribeResponse,
 )
+from .responses import ORJSONResponse, amodel_response
 from .transcription import WhisperService
 
 # Configure logging
@@ -34,11 +37,44 @@ STORAGE_DIR = Path(os.getenv("STENO_STORAGE_DIR", "./storage"))
 VIDEO_STORAGE_DIR = STORAGE_DIR / "videos"
 RENDER_OUTPUT_DIR = STORAGE_DIR / "renders"
 
+# Uploads are copied to disk in chunks of this many bytes
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Accepted upload extensions (lowercase, with the leading dot)
+_ALLOWED_VIDEO_EXTS: frozenset[str] = frozenset(
+    {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}
+)
+
+# Video IDs are secrets.token_urlsafe() output (older ones are UUIDs), so
+# anything outside this charset can't name a stored video
+_VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+# Content-Type for each stored video extension
+_EXT_TO_MIME = {
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".avi": "video/x-msvideo",
+    ".mkv": "video/x-matroska",
+    ".webm": "video/webm",
+    ".m4v": "video/x-m4v",
+}
+
+# Frontend origins allowed by CORS during local development
+_CORS_ORIGINS = [
+    "http://localhost:5173",
+    "http://localhost:3000",
+    "http://127.0.0.1:5173",
+]
+
 audio_processor: AudioProcessor | None = None
 whisper_service: WhisperService | None = None
 caption_segmenter: CaptionSegmenter | None = None
 caption_stylizer: CaptionStylizer | None = None
 
+# Stored videos by ID, so lookups don't have to scan VIDEO_STORAGE_DIR. Each
+# worker process has its own index; see _find_video for misses
+_video_index: dict[str, Path] = {}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -51,11 +87,30 @@ async def lifespan(app: FastAPI):
     RENDER_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     logger.info(f"Storage directories created: {STORAGE_DIR}")
 
+    # Index videos stored by earlier runs
+    with os.scandir(VIDEO_STORAGE_DIR) as entries:
+        for entry in entries:
+            if entry.is_file():
+                path = Path(entry.path)
+                _video_index[path.stem] = path
+    logger.info(f"Indexed {len(_video_index)} stored videos")
+
     # Initialize services
     audio_processor = AudioProcessor()
-    whisper_service = WhisperService(model_name=os.getenv("WHISPER_MODEL", "small"))
+    whisper_service = WhisperService(
+        model_name=os.getenv("WHISPER_MODEL", "small"),
+        backend=os.getenv("WHISPER_BACKEND", "openai-whisper"),
+        download_root=os.getenv("WHISPER_CACHE_DIR"),
+    )
     caption_segmenter = CaptionSegmenter()
-    caption_stylizer = CaptionStylizer()
+    caption_stylizer = CaptionStylizer(
+        use_nlp=os.getenv("STENO_STYLIZER_NLP", "0") == "1"
+    )
+
+    # Load spaCy now so the first request doesn't pay for it
+    if caption_stylizer.use_nlp:
+        await asyncio.to_thread(caption_stylizer.warmup)
+        logger.info("spaCy model warmed up")
 
     logger.info("Steno API services initialized")
 
@@ -70,16 +125,14 @@ app = FastAPI(
     description="Speech-to-text and caption intelligence for video captioning",
     version="0.1.0",
     lifespan=lifespan,
+    # Caption responses carry per-word timings; orjson encodes them much faster
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS for local development
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",
-        "http://localhost:3000",
-        "http://127.0.0.1:5173",
-    ],
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -109,18 +162,17 @@ async def transcribe_video(
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
 
-    allowed_extensions = {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}
     ext = Path(file.filename).suffix.lower()
-    if ext not in allowed_extensions:
+    if ext not in _ALLOWED_VIDEO_EXTS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type. Allowed: {allowed_extensions}",
+            detail=f"Invalid file type. Allowed: {set(_ALLOWED_VIDEO_EXTS)}",
         )
 
     # Save uploaded file to temp location
     with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp_video:
-        content = await file.read()
-        tmp_video.write(content)
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            tmp_video.write(chunk)
         tmp_video_path = tmp_video.name
 
     audio_path = None
@@ -128,17 +180,20 @@ async def transcribe_video(
         # Extract audio
         logger.info(f"Processing uploaded file: {file.filename}")
         logger.info("Extracting audio from video")
-        audio_path = audio_processor.extract_audio(tmp_video_path)
+        audio_path = await audio_processor.aextract_audio(tmp_video_path)
 
         # Transcribe
-        transcript = whisper_service.transcribe(audio_path, language=language)
+        transcript = await asyncio.to_thread(
+            whisper_service.transcribe, audio_path, language=language
+        )
 
         processing_time = (time.time() - start_time) * 1000
 
-        return TranscribeResponse(
+        response = TranscribeResponse(
             transcript=transcript,
             processingTime=processing_time,
         )
+        return await amodel_response(response, len(transcript.words))
 
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -165,24 +220,24 @@ async def generate_captions(request: GenerateCaptionsRequest):
     start_time = time.time()
 
     try:
-        # Update segmenter settings
-        caption_segmenter.max_words = request.max_words_per_caption
-
         # Segment transcript into caption phrases
-        captions_list = caption_segmenter.segment(
+        captions_list = await asyncio.to_thread(
+            caption_segmenter.segment,
             transcript=request.transcript,
             default_animation=request.default_animation,
+            max_words=request.max_words_per_caption,
         )
 
         # Apply styling
-        captions = caption_stylizer.stylize(captions_list)
+        captions = await asyncio.to_thread(caption_stylizer.stylize, captions_list)
 
         processing_time = (time.time() - start_time) * 1000
 
-        return GenerateCaptionsResponse(
+        response = GenerateCaptionsResponse(
             captions=captions,
             processingTime=processing_time,
         )
+        return await amodel_response(response, len(captions.captions))
 
     except Exception as e:
         logger.error(f"Caption generation failed: {e}")
@@ -217,12 +272,11 @@ async def process_video(
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
 
-    allowed_extensions = {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}
     ext = Path(file.filename).suffix.lower()
-    if ext not in allowed_extensions:
+    if ext not in _ALLOWED_VIDEO_EXTS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type. Allowed: {allowed_extensions}",
+            detail=f"Invalid file type. Allowed: {set(_ALLOWED_VIDEO_EXTS)}",
         )
 
     # Parse animation enum
@@ -232,56 +286,66 @@ async def process_video(
         animation = CaptionAnimation.SCALE_IN
 
     # Generate unique video ID and save to storage
-    video_id = str(uuid.uuid4())
+    video_id = secrets.token_urlsafe(16)
     video_path = VIDEO_STORAGE_DIR / f"{video_id}{ext}"
 
     # Save uploaded file to storage
-    content = await file.read()
     with open(video_path, "wb") as f:
-        f.write(content)
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            f.write(chunk)
+    _video_index[video_id] = video_path
 
     audio_path = None
     try:
         # Extract audio
         logger.info(f"Processing uploaded file: {file.filename}")
         logger.info(f"Stored video with ID: {video_id}")
-        audio_path = audio_processor.extract_audio(str(video_path))
+        audio_path = await audio_processor.aextract_audio(video_path)
 
         # Get video duration
-        video_duration = audio_processor.get_duration(str(video_path))
+        video_duration = await asyncio.to_thread(
+            audio_processor.get_duration, video_path
+        )
 
         # Transcribe
-        transcript = whisper_service.transcribe(audio_path, language=language)
-
-        # Update segmenter settings
-        caption_segmenter.max_words = max_words_per_caption
+        transcript = await asyncio.to_thread(
+            whisper_service.transcribe, audio_path, language=language
+        )
 
         # Segment into captions
-        captions_list = caption_segmenter.segment(
+        captions_list = await asyncio.to_thread(
+            caption_segmenter.segment,
             transcript=transcript,
             default_animation=animation,
+            max_words=max_words_per_caption,
         )
 
         # Apply styling
-        captions = caption_stylizer.stylize(captions_list)
+        captions = await asyncio.to_thread(caption_stylizer.stylize, captions_list)
 
         processing_time = (time.time() - start_time) * 1000
 
-        return ProcessResponse(
+        response = ProcessResponse(
             transcript=transcript,
             captions=captions,
             processingTime=processing_time,
             videoId=video_id,
             videoDuration=video_duration,
         )
+        # Return the dump directly so FastAPI skips jsonable_encoder
+        return await amodel_response(
+            response, len(transcript.words) + len(captions.captions)
+        )
 
     except FileNotFoundError as e:
         # Clean up stored video on error
+        _video_index.pop(video_id, None)
         if video_path.exists():
             video_path.unlink()
         raise HTTPException(status_code=404, detail=str(e)) from e
     except RuntimeError as e:
         # Clean up stored video on error
+        _video_index.pop(video_id, None)
         if video_path.exists():
             video_path.unlink()
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -303,16 +367,24 @@ async def get_video(video_id: str):
     Args:
         video_id: The video ID returned from the process endpoint.
     """
-    # Find the video file (could have different extensions)
-    video_files = list(VIDEO_STORAGE_DIR.glob(f"{video_id}.*"))
-    if not video_files:
+    video_path = _find_video(video_id)
+    if video_path is None:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    video_path = video_files[0]
+    # Stat once here; FileResponse would otherwise stat the file itself
+    try:
+        stat_result = video_path.stat()
+    except FileNotFoundError as e:
+        _video_index.pop(video_id, None)
+        raise HTTPException(status_code=404, detail="Video not found") from e
+
     return FileResponse(
         path=video_path,
-        media_type="video/mp4",
+        media_type=_EXT_TO_MIME.get(
+            video_path.suffix.lower(), "application/octet-stream"
+        ),
         filename=video_path.name,
+        stat_result=stat_result,
     )
 
 
@@ -323,12 +395,12 @@ async def delete_video(video_id: str):
     Args:
         video_id: The video ID to delete.
     """
-    video_files = list(VIDEO_STORAGE_DIR.glob(f"{video_id}.*"))
-    if not video_files:
+    video_path = _find_video(video_id)
+    if video_path is None:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    for video_file in video_files:
-        video_file.unlink()
+    _video_index.pop(video_id, None)
+    video_path.unlink(missing_ok=True)
 
     logger.info(f"Deleted video: {video_id}")
     return {"status": "deleted", "videoId": video_id}
@@ -343,8 +415,35 @@ def get_video_path(video_id: str) -> Path | None:
     Returns:
         Path to the video file, or None if not found.
     """
-    video_files = list(VIDEO_STORAGE_DIR.glob(f"{video_id}.*"))
-    return video_files[0] if video_files else None
+    return _find_video(video_id)
+
+
+def _find_video(video_id: str) -> Path | None:
+    """Look up a stored video, falling back to storage on an index miss.
+
+    The index only knows videos that existed at startup or were uploaded to
+    this worker, so on a miss each allowed extension is probed directly and
+    a hit is added to the index.
+
+    Args:
+        video_id: The video ID.
+
+    Returns:
+        Path to the video file, or None if not found.
+    """
+    video_path = _video_index.get(video_id)
+    if video_path is not None:
+        return video_path
+
+    if not _VIDEO_ID_RE.fullmatch(video_id):
+        return None
+
+    for ext in _ALLOWED_VIDEO_EXTS:
+        video_path = VIDEO_STORAGE_DIR / f"{video_id}{ext}"
+        if video_path.is_file():
+            _video_index[video_id] = video_path
+            return video_path
+    return None
 
 
 # ============================================
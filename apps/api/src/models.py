@@ -4,8 +4,13 @@ These models mirror the TypeScript contracts in @steno/contracts.
 """
 
 from enum import StrEnum
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
+
+# Shared by models with camelCase aliases: accept both the alias and the
+# field name on input, and drop unknown fields
+_ALIASED_MODEL_CONFIG = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 class CaptionStyle(StrEnum):
@@ -39,6 +44,18 @@ class CaptionPositionPreset(StrEnum):
     BOTTOM_RIGHT = "bottom-right"
 
 
+# Enum values as the plain strings Caption stores (use_enum_values). Code that
+# builds or copies many captions uses these: an Enum attribute lookup costs an
+# order of magnitude more than a module global, and model_copy() doesn't
+# validate, so passing members would leave enums in copied captions
+STYLE_NORMAL: str = CaptionStyle.NORMAL.value
+STYLE_BOLD: str = CaptionStyle.BOLD.value
+STYLE_ITALIC: str = CaptionStyle.ITALIC.value
+STYLE_HIGHLIGHT: str = CaptionStyle.HIGHLIGHT.value
+ANIMATION_SCALE_IN: str = CaptionAnimation.SCALE_IN.value
+ANIMATION_WORD_BY_WORD: str = CaptionAnimation.WORD_BY_WORD.value
+
+
 class CaptionPositionCoords(BaseModel):
     """Freeform position with x/y coordinates (percentage-based, 0-100)."""
 
@@ -46,6 +63,23 @@ class CaptionPositionCoords(BaseModel):
     y: float = Field(..., ge=0, le=100, description="Y position as percentage")
 
 
+def _position_kind(value: Any) -> str:
+    """Tag a caption position as "coords" (x/y object) or "preset" (string)."""
+    if isinstance(value, dict | CaptionPositionCoords):
+        return "coords"
+    return "preset"
+
+
+# Preset string or x/y object. The callable discriminator keeps the wire
+# format of the contracts (no tag field) while letting pydantic-core pick the
+# variant directly instead of trying each one in turn.
+CaptionPosition = Annotated[
+    Annotated[CaptionPositionPreset, Tag("preset")]
+    | Annotated[CaptionPositionCoords, Tag("coords")],
+    Discriminator(_position_kind),
+]
+
+
 class TranscriptWord(BaseModel):
     """A single word from speech-to-text with timing information."""
 
@@ -85,17 +119,21 @@ class CaptionWord(BaseModel):
 class Caption(BaseModel):
     """A single caption segment (lyric-style phrase)."""
 
+    # Store style/animation/position presets as plain strings, so dumping the
+    # (often hundreds of) captions in a response needs no enum conversion
+    model_config = ConfigDict(use_enum_values=True)
+
     id: str = Field(..., description="Unique identifier")
     text: str = Field(..., description="Full text of the caption segment")
     start: float = Field(..., ge=0, description="Start time in seconds")
     end: float = Field(..., ge=0, description="End time in seconds")
     words: list[CaptionWord] = Field(..., description="Individual words with timing")
     emphasis: list[str] = Field(default_factory=list, description="Words to emphasize")
-    style: CaptionStyle = Field(default=CaptionStyle.NORMAL, description="Visual style")
+    style: CaptionStyle = Field(default=STYLE_NORMAL, description="Visual style")
     animation: CaptionAnimation = Field(
-        default=CaptionAnimation.SCALE_IN, description="Animation type"
+        default=ANIMATION_SCALE_IN, description="Animation type"
     )
-    position: CaptionPositionPreset | CaptionPositionCoords = Field(
+    position: CaptionPosition = Field(
         default_factory=lambda: CaptionPositionCoords(x=50, y=50),
         description="Position - preset or freeform coordinates",
     )
@@ -137,18 +175,19 @@ class Captions(BaseModel):
 class TranscribeResponse(BaseModel):
     """Transcription response."""
 
+    model_config = _ALIASED_MODEL_CONFIG
+
     transcript: Transcript = Field(..., description="The transcript")
     processing_time: float = Field(
         ..., alias="processingTime", description="Processing time in milliseconds"
     )
 
-    class Config:
-        populate_by_name = True
-
 
 class GenerateCaptionsRequest(BaseModel):
     """Caption generation request."""
 
+    model_config = _ALIASED_MODEL_CONFIG
+
     transcript: Transcript = Field(..., description="Input transcript")
     max_words_per_caption: int = Field(
         default=4, alias="maxWordsPerCaption", description="Maximum words per caption"
@@ -159,25 +198,23 @@ class GenerateCaptionsRequest(BaseModel):
         description="Default animation style",
     )
 
-    class Config:
-        populate_by_name = True
-
 
 class GenerateCaptionsResponse(BaseModel):
     """Caption generation response."""
 
+    model_config = _ALIASED_MODEL_CONFIG
+
     captions: Captions = Field(..., description="Generated captions")
     processing_time: float = Field(
         ..., alias="processingTime", description="Processing time in milliseconds"
     )
 
-    class Config:
-        populate_by_name = True
-
 
 class ProcessResponse(BaseModel):
     """Combined process response (video to captions)."""
 
+    model_config = _ALIASED_MODEL_CONFIG
+
     transcript: Transcript = Field(..., description="The transcript")
     captions: Captions = Field(..., description="Generated captions")
     processing_time: float = Field(
@@ -190,9 +227,6 @@ class ProcessResponse(BaseModel):
         ..., alias="videoDuration", description="Video duration in seconds"
     )
 
-    class Config:
-        populate_by_name = True
-
 
 class HealthResponse(BaseModel):
     status: str = Field(default="ok", description="Service status")
@@ -208,6 +242,8 @@ class HealthResponse(BaseModel):
 class RenderRequest(BaseModel):
     """Render request."""
 
+    model_config = _ALIASED_MODEL_CONFIG
+
     video_id: str = Field(..., alias="videoId", description="Video ID")
     captions: Captions = Field(..., description="Captions to overlay")
     aspect_ratio: str = Field(
@@ -215,13 +251,12 @@ class RenderRequest(BaseModel):
     )
     quality: int = Field(default=80, ge=0, le=100, description="Output quality")
 
-    class Config:
-        populate_by_name = True
-
 
 class RenderProgress(BaseModel):
     """Render progress response."""
 
+    model_config = _ALIASED_MODEL_CONFIG
+
     job_id: str = Field(..., alias="jobId", description="Render job ID")
     status: str = Field(..., description="Current status")
     progress: int = Field(default=0, ge=0, le=100, description="Progress percentage")
@@ -229,6 +264,3 @@ class RenderProgress(BaseModel):
     output_url: str | None = Field(
         default=None, alias="outputUrl", description="Output video URL when complete"
     )
-
-    class Config:
-        populate_by_name = True
@@ -0,0 +1,57 @@
+"""JSON response class backed by orjson."""
+
+import asyncio
+from enum import Enum
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Responses with more list items than this (captions, transcript words) are
+# encoded in a worker thread so they don't block the event loop
+LARGE_RESPONSE_ITEMS = 200
+
+
+def _default(obj: Any) -> Any:
+    """Encode values orjson doesn't handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Handlers can pass a plain model_dump() dict as content to skip FastAPI's
+    jsonable_encoder pass; nested models and enums are still encoded.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def model_response(model: BaseModel) -> ORJSONResponse:
+    """Encode a response model by alias, skipping jsonable_encoder."""
+    return ORJSONResponse(model.model_dump(by_alias=True))
+
+
+async def amodel_response(model: BaseModel, num_items: int) -> ORJSONResponse:
+    """Encode a response model, in a worker thread if it is large.
+
+    Args:
+        model: Response model to encode.
+        num_items: Number of list items (captions, words) in the model.
+
+    Returns:
+        The encoded response.
+    """
+    if num_items <= LARGE_RESPONSE_ITEMS:
+        return model_response(model)
+    return await asyncio.to_thread(model_response, model)
@@ -1,14 +1,54 @@
 """Whisper integration for speech-to-text with word-level timestamps."""
 
+from __future__ import annotations
+
+import bisect
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-import whisper
+import numpy as np
+from pydantic import TypeAdapter
 
 from ..models import Transcript, TranscriptWord
 
+if TYPE_CHECKING:
+    import torch
+    import whisper
+    from faster_whisper import WhisperModel
+
 logger = logging.getLogger(__name__)
 
+# Validates a whole list of raw word dicts in one pydantic-core call
+_WORDS_ADAPTER = TypeAdapter(list[TranscriptWord])
+
+
+class _WordColumns(NamedTuple):
+    """Extracted words as parallel columns.
+
+    Post-processing works on these plain lists; TranscriptWord models are only
+    built once, when the Transcript is assembled.
+    """
+
+    texts: list[str]
+    starts: list[float]
+    ends: list[float]
+    confidences: list[float | None]
+
+
+class _RawTranscript(NamedTuple):
+    """Output of one backend run, before timing normalization."""
+
+    columns: _WordColumns
+    text: str
+    duration: float
+    language: str
+
 
 class WhisperService:
     """Speech-to-text service using OpenAI Whisper."""
@@ -17,7 +57,33 @@ class WhisperService:
     # Changed default from "base" to "small" for better accuracy
     DEFAULT_MODEL = "small"
 
-    def __init__(self, model_name: str | None = None):
+    # Inference backends: the reference PyTorch implementation, or
+    # faster-whisper (CTranslate2, int8 quantized; optional dependency)
+    BACKENDS = ("openai-whisper", "faster-whisper")
+    DEFAULT_BACKEND = "openai-whisper"
+
+    # Loaded models kept in memory, so switching back and forth between two
+    # model sizes doesn't reload weights each time
+    MODEL_CACHE_SIZE = 2
+
+    # Transcripts kept by audio content, model and language, so transcribing
+    # the same audio again (e.g. re-processing an edited project) is a lookup
+    TRANSCRIPT_CACHE_SIZE = 32
+
+    # Timing normalization (seconds): overlaps shorter than this are snapped
+    # to the previous word's end; longer ones are left alone
+    MAX_SNAP_OVERLAP = 0.1
+    # Duration given to words whose end is not after their start
+    INVALID_WORD_DURATION = 0.05
+    # Minimum duration of any word
+    MIN_WORD_DURATION = 0.03
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        backend: str | None = None,
+        download_root: str | None = None,
+    ):
         """Initialize the Whisper service.
 
         Args:
@@ -26,19 +92,78 @@ class WhisperService:
                 - tiny/base: Fast but less accurate
                 - small: Good balance (default)
                 - medium/large: More accurate but slower
+            backend: Inference backend, one of BACKENDS.
+                Defaults to "openai-whisper".
+            download_root: Directory for downloaded model weights. Defaults
+                to the backend's own cache directory.
+
+        Raises:
+            ValueError: If backend is unknown.
         """  # noqa: E501
         self.model_name = model_name or self.DEFAULT_MODEL
-        self._model: whisper.Whisper | None = None
-        logger.info(f"WhisperService initialized with model: {self.model_name}")
+        self.backend = backend or self.DEFAULT_BACKEND
+        if self.backend not in self.BACKENDS:
+            raise ValueError(
+                f"Invalid backend: {self.backend}. Available: {list(self.BACKENDS)}"
+            )
+        self.download_root = download_root
+        self._models: OrderedDict[str, whisper.Whisper | WhisperModel] = OrderedDict()
+        # Whisper installs KV-cache hooks on the model while decoding, so only
+        # one transcription may use it at a time
+        self._model_lock = threading.Lock()
+        self._transcripts: OrderedDict[tuple, Transcript] = OrderedDict()
+        self._transcripts_lock = threading.Lock()
+        logger.info(
+            f"WhisperService initialized with model: {self.model_name} "
+            f"({self.backend})"
+        )
 
     @property
-    def model(self) -> whisper.Whisper:
-        """Lazy-load the Whisper model."""
-        if self._model is None:
-            logger.info(f"Loading Whisper model: {self.model_name}")
-            self._model = whisper.load_model(self.model_name)
-            logger.info("Whisper model loaded successfully")
-        return self._model
+    def model(self) -> whisper.Whisper | WhisperModel:
+        """Lazy-load the Whisper model, reusing recently loaded ones."""
+        model = self._models.get(self.model_name)
+        if model is None:
+            model = self._load_model(self.model_name)
+            self._models[self.model_name] = model
+            while len(self._models) > self.MODEL_CACHE_SIZE:
+                evicted, _ = self._models.popitem(last=False)
+                logger.info(f"Evicted Whisper model from cache: {evicted}")
+        else:
+            self._models.move_to_end(self.model_name)
+        return model
+
+    def _load_model(self, model_name: str) -> whisper.Whisper | WhisperModel:
+        """Load a Whisper model with the configured backend.
+
+        Args:
+            model_name: Model to load.
+
+        Returns:
+            The loaded model.
+        """
+        logger.info(f"Loading Whisper model: {model_name} ({self.backend})")
+        if self.backend == "faster-whisper":
+            import ctranslate2
+            from faster_whisper import WhisperModel
+
+            # int8 weights; keep float16 activations where a GPU is present
+            if ctranslate2.get_cuda_device_count() > 0:
+                compute_type = "int8_float16"
+            else:
+                compute_type = "int8"
+            model = WhisperModel(
+                model_name,
+                device="auto",
+                compute_type=compute_type,
+                download_root=self.download_root,
+            )
+        else:
+            # Imported here: whisper pulls in torch, which is slow to import
+            import whisper
+
+            model = whisper.load_model(model_name, download_root=self.download_root)
+        logger.info("Whisper model loaded successfully")
+        return model
 
     def transcribe(
         self,
@@ -61,46 +186,45 @@ class WhisperService:
             RuntimeError: If transcription fails.
         """
         audio_path = Path(audio_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        try:
+            size = os.stat(audio_path).st_size
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Audio file not found: {audio_path}") from e
 
         logger.info(f"Transcribing: {audio_path}")
 
         try:
-            # Enhanced transcription parameters for better accuracy
-            # - beam_size: Higher values = better accuracy (5 is good)
-            # - best_of: Generate multiple candidates and pick best
-            # - temperature: Lower = more deterministic (0.0 for greedy)
-            # - condition_on_previous_text: False reduces repetition
-            result = self.model.transcribe(
-                str(audio_path),
-                language=language,
-                word_timestamps=True,
-                verbose=False,
-                # Improved parameters for better accuracy
-                beam_size=5,  # Beam search for better decoding
-                best_of=5,  # Generate 5 candidates, pick best
-                temperature=0.0,  # More deterministic, less random
-                condition_on_previous_text=False,  # Reduce repetition
-                # Suppression parameters
-                suppress_blank=True,  # Suppress blank outputs
-                suppress_tokens=[-1],  # Suppress special tokens
-                # Better silence detection
-                no_speech_threshold=0.6,  # No-speech detection threshold
-            )
-
-            # Extract word-level data
-            words = self._extract_words(result)
+            with open(audio_path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha1").hexdigest()
+            cache_key = (digest, size, self.backend, self.model_name, language)
+            with self._transcripts_lock:
+                cached = self._transcripts.get(cache_key)
+                if cached is not None:
+                    self._transcripts.move_to_end(cache_key)
+            if cached is not None:
+                logger.info(f"Transcript cache hit: {audio_path}")
+                return cached
+
+            # Decode before taking the model lock, so concurrent requests
+            # decode their audio while another request is being transcribed
+            audio = self._load_audio(audio_path)
+
+            with self._model_lock:
+                if self.backend == "faster-whisper":
+                    raw = self._run_faster_whisper(audio, language)
+                else:
+                    raw = self._run_openai_whisper(audio, language)
 
             # Normalize word timings for accuracy
-            words = self._normalize_word_timings(words)
+            columns = self._normalize_word_timings(raw.columns)
 
-            # Build transcript
-            transcript = Transcript(
+            # Build transcript; the words are validated in one batch here
+            words = self._build_words(columns)
+            transcript = Transcript.model_construct(
                 words=words,
-                text=result.get("text", "").strip(),
-                duration=self._get_duration(result),
-                language=result.get("language", language or "en"),
+                text=raw.text,
+                duration=raw.duration,
+                language=raw.language,
             )
 
             logger.info(
@@ -108,57 +232,211 @@ class WhisperService:
                 f"{transcript.duration:.2f}s, model: {self.model_name}"
             )
 
+            with self._transcripts_lock:
+                self._transcripts[cache_key] = transcript
+                while len(self._transcripts) > self.TRANSCRIPT_CACHE_SIZE:
+                    self._transcripts.popitem(last=False)
+
             return transcript
 
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise RuntimeError(f"Transcription failed: {e}") from e
 
-    def _extract_words(self, result: dict) -> list[TranscriptWord]:
-        """Extract word-level data from Whisper result.
+    def _load_audio(self, audio_path: Path) -> np.ndarray:
+        """Decode an audio file to 16 kHz mono float32 samples.
 
-        Enhanced with confidence filtering for better quality.
+        Args:
+            audio_path: Path to the audio file.
+
+        Returns:
+            Audio samples for the configured backend.
+        """
+        if self.backend == "faster-whisper":
+            from faster_whisper import decode_audio
+
+            return decode_audio(str(audio_path))
+
+        import whisper
+
+        return whisper.load_audio(str(audio_path))
+
+    def _run_openai_whisper(
+        self, audio: np.ndarray, language: str | None
+    ) -> _RawTranscript:
+        """Transcribe with the openai-whisper backend.
+
+        Args:
+            audio: Decoded audio samples.
+            language: Language code, or None to auto-detect.
+
+        Returns:
+            Extracted words, text, duration and language.
+        """
+        model = self.model
+        samples: np.ndarray | torch.Tensor = audio
+        if model.device.type == "cuda":
+            import torch
+
+            # whisper computes the log-mel spectrogram on the audio tensor's
+            # device, so moving the samples to the GPU moves the STFT there too
+            samples = torch.from_numpy(audio).to(model.device)
+
+        # Enhanced transcription parameters for better accuracy
+        # - beam_size: Higher values = better accuracy (5 is good)
+        # - best_of: Generate multiple candidates and pick best
+        # - temperature: Lower = more deterministic (0.0 for greedy)
+        # - condition_on_previous_text: False reduces repetition
+        result = model.transcribe(
+            samples,
+            language=language,
+            word_timestamps=True,
+            verbose=False,
+            # Improved parameters for better accuracy
+            beam_size=5,  # Beam search for better decoding
+            best_of=5,  # Generate 5 candidates, pick best
+            temperature=0.0,  # More deterministic, less random
+            condition_on_previous_text=False,  # Reduce repetition
+            # Suppression parameters
+            suppress_blank=True,  # Suppress blank outputs
+            suppress_tokens=[-1],  # Suppress special tokens
+            # Better silence detection
+            no_speech_threshold=0.6,  # No-speech detection threshold
+        )
+
+        return _RawTranscript(
+            columns=self._extract_words(result),
+            text=result.get("text", "").strip(),
+            duration=self._get_duration(result),
+            language=result.get("language", language or "en"),
+        )
+
+    def _run_faster_whisper(
+        self, audio: np.ndarray, language: str | None
+    ) -> _RawTranscript:
+        """Transcribe with the faster-whisper backend.
+
+        Uses the same decoding parameters as the openai-whisper backend, plus
+        VAD filtering to skip silence before decoding.
+
+        Args:
+            audio: Decoded audio samples.
+            language: Language code, or None to auto-detect.
+
+        Returns:
+            Extracted words, text, duration and language.
+        """
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            word_timestamps=True,
+            beam_size=5,
+            best_of=5,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            suppress_blank=True,
+            suppress_tokens=[-1],
+            no_speech_threshold=0.6,
+            vad_filter=True,
+        )
+
+        # Segments are decoded lazily, so this loop is where inference runs.
+        # Each segment's words go straight into the columns as it arrives,
+        # instead of buffering every segment until decoding finishes
+        columns = _WordColumns([], [], [], [])
+        texts = []
+        duration = 0.0
+        for segment in segments:
+            texts.append(segment.text)
+            duration = segment.end
+            self._add_segment_words(
+                columns,
+                (
+                    {
+                        "word": word.word,
+                        "start": word.start,
+                        "end": word.end,
+                        "probability": word.probability,
+                    }
+                    for word in segment.words or ()
+                ),
+            )
+
+        return _RawTranscript(
+            columns=columns,
+            text="".join(texts).strip(),
+            duration=duration,
+            language=info.language,
+        )
+
+    def _extract_words(self, result: dict) -> _WordColumns:
+        """Extract word-level data from Whisper result.
 
         Args:
             result: Raw Whisper transcription result.
 
         Returns:
-            List of TranscriptWord objects.
+            Words as parallel columns.
+        """
+        columns = _WordColumns([], [], [], [])
+        # With word_timestamps=True every segment has "words"
+        for segment in result["segments"]:
+            self._add_segment_words(columns, segment["words"])
+        return columns
+
+    def _add_segment_words(
+        self, columns: _WordColumns, segment_words: Iterable[dict]
+    ) -> None:
+        """Append one segment's words to the columns.
+
+        Enhanced with confidence filtering for better quality.
+
+        Args:
+            columns: Columns to append to (modified in place).
+            segment_words: Whisper word dicts for the segment.
         """
-        words = []
+        texts, starts, ends, confidences = columns
         # Filter out very low confidence words
         min_confidence = 0.1
 
-        segments = result.get("segments", [])
-        for segment in segments:
-            segment_words = segment.get("words", [])
-            for word_data in segment_words:
-                word_text = word_data.get("word", "").strip()
-                confidence = word_data.get("probability")
+        # Every word has all four keys, so index directly instead of .get()
+        for word_data in segment_words:
+            word_text = word_data["word"].strip()
+            confidence = word_data["probability"]
 
-                # Filter low-confidence words (optional, can be adjusted)
-                if confidence is not None and confidence < min_confidence:
-                    logger.debug(
-                        f"Filtered low-confidence word: '{word_text}' "
-                        f"(confidence: {confidence:.2f})"  # noqa: E501
-                    )
-                    continue
-
-                word = TranscriptWord(
-                    text=word_text,
-                    start=word_data.get("start", 0.0),
-                    end=word_data.get("end", 0.0),
-                    confidence=confidence,
+            # Filter low-confidence words (optional, can be adjusted)
+            if confidence is not None and confidence < min_confidence:
+                logger.debug(
+                    "Filtered low-confidence word: '%s' (confidence: %.2f)",
+                    word_text,
+                    confidence,
                 )
-                # Only add non-empty words
-                if word.text:
-                    words.append(word)
+                continue
 
-        return words
+            # Only add non-empty words
+            if word_text:
+                texts.append(word_text)
+                starts.append(word_data["start"])
+                ends.append(word_data["end"])
+                confidences.append(confidence)
 
-    def _normalize_word_timings(
-        self, words: list[TranscriptWord]
-    ) -> list[TranscriptWord]:
+    def _build_words(self, columns: _WordColumns) -> list[TranscriptWord]:
+        """Validate word columns into TranscriptWord models in one call.
+
+        Args:
+            columns: Words as parallel columns.
+
+        Returns:
+            List of TranscriptWord objects.
+        """
+        return _WORDS_ADAPTER.validate_python(
+            [
+                {"text": text, "start": start, "end": end, "confidence": confidence}
+                for text, start, end, confidence in zip(*columns, strict=True)
+            ]
+        )
+
+    def _normalize_word_timings(self, words: _WordColumns) -> _WordColumns:
         """Normalize word timings to ensure sequential, non-overlapping timestamps.
 
         Fixes timing accuracy issues by:
@@ -168,52 +446,80 @@ class WhisperService:
         - Fixing invalid timing ranges
 
         Args:
-            words: List of words with potentially overlapping/incorrect timings.
+            words: Words with potentially overlapping/incorrect timings.
 
         Returns:
-            List of words with normalized, sequential timings.
+            Words with normalized, sequential timings.
         """
-        if not words:
+        n = len(words.texts)
+        if not n:
+            return words
+
+        starts = np.array(words.starts, dtype=np.float64)
+        ends = np.array(words.ends, dtype=np.float64)
+
+        # Find words that break a rule against the original timings. Only
+        # these, plus the words after any word whose end gets moved, need
+        # fixing; everything else is already sequential and long enough.
+        prev_ends = np.concatenate(([0.0], ends[:-1]))
+        needs_fix = (starts < prev_ends) | (ends - starts < self.MIN_WORD_DURATION)
+        candidates = np.flatnonzero(needs_fix).tolist()
+        if not candidates:
             return words
 
-        normalized = []
-        prev_end = 0.0
+        starts_list = starts.tolist()
+        ends_list = ends.tolist()
+        texts = words.texts
+        pos = 0
+        i = candidates[0]
+        while i < n:
+            start = starts_list[i]
+            end = ends_list[i]
+            prev_end = ends_list[i - 1] if i else 0.0
 
-        for word in words:
             # Ensure start time is not before previous end time
-            if word.start < prev_end:
+            if start < prev_end:
                 # Small overlap: adjust start to prev_end
                 # Larger gap: keep original start if gap is reasonable
-                gap = word.start - prev_end
-                if gap > -0.1:  # Less than 100ms overlap
-                    word.start = max(prev_end, word.start)
+                gap = start - prev_end
+                if gap > -self.MAX_SNAP_OVERLAP:
+                    start = prev_end
                 else:
                     # Significant overlap, keep original but warn
                     logger.debug(
-                        f"Warning: Significant timing overlap for "
-                        f"word '{word.text}': start={word.start:.3f}, "
-                        f"prev_end={prev_end:.3f}"
+                        "Warning: Significant timing overlap for "
+                        "word '%s': start=%.3f, prev_end=%.3f",
+                        texts[i],
+                        start,
+                        prev_end,
                     )
 
             # Ensure end time is after start time
-            if word.end <= word.start:
+            if end <= start:
                 # If end <= start, set a minimum duration
-                min_duration = 0.05  # 50ms minimum
-                word.end = word.start + min_duration
+                end = start + self.INVALID_WORD_DURATION
                 logger.debug(
-                    f"Fixed invalid timing for word '{word.text}': "
-                    f"start={word.start:.3f}, end={word.end:.3f}"  # noqa: E501
+                    "Fixed invalid timing for word '%s': start=%.3f, end=%.3f",
+                    texts[i],
+                    start,
+                    end,
                 )
 
             # Ensure minimum word duration (prevents zero-length words)
-            min_duration = 0.03  # 30ms minimum
-            if word.end - word.start < min_duration:
-                word.end = word.start + min_duration
+            if end - start < self.MIN_WORD_DURATION:
+                end = start + self.MIN_WORD_DURATION
 
-            normalized.append(word)
-            prev_end = word.end
+            starts_list[i] = start
+            if end != ends_list[i]:
+                # The next word must be rechecked against the new end
+                ends_list[i] = end
+                i += 1
+            else:
+                # Jump straight to the next flagged word
+                pos = bisect.bisect_right(candidates, i, pos)
+                i = candidates[pos] if pos < len(candidates) else n
 
-        return normalized
+        return words._replace(starts=starts_list, ends=ends_list)
 
     def _get_duration(self, result: dict) -> float:
         """Get total duration from Whisper result.
@@ -224,13 +530,12 @@ class WhisperService:
         Returns:
             Duration in seconds.
         """
-        segments = result.get("segments", [])
+        segments = result["segments"]
         if not segments:
             return 0.0
 
         # Get the end time of the last segment
-        last_segment = segments[-1]
-        return last_segment.get("end", 0.0)
+        return segments[-1]["end"]
 
     def get_available_models(self) -> list[str]:
         """Get list of available Whisper models.
@@ -255,5 +560,6 @@ class WhisperService:
 
         if model_name != self.model_name:
             logger.info(f"Changing model from {self.model_name} to {model_name}")
-            self.model_name = model_name
-            self._model = None  # Force reload on next use
+            # Loaded models stay cached; the next call loads this one if needed
+            with self._model_lock:
+                self.model_name = model_name
@@ -0,0 +1,114 @@
+"""Tests for caption segmentation."""
+
+import random
+
+import pytest
+
+from src.captions.segmenter import CaptionSegmenter
+from src.models import Transcript, TranscriptWord
+
+
+def make_words(text: str, gap: float = 0.1) -> list[TranscriptWord]:
+    """Build words from text; "|" marks a long pause between two words."""
+    words = []
+    t = 0.0
+    for token in text.split():
+        if token == "|":
+            t += 1.0
+            continue
+        words.append(TranscriptWord(text=token, start=t, end=t + 0.3))
+        t += 0.3 + gap
+    return words
+
+
+def reference_phrases(
+    words: list[TranscriptWord], max_words: int, min_words: int
+) -> list[list[TranscriptWord]]:
+    """Per-word grouping followed by a separate short-phrase merge pass."""
+    phrases: list[list[TranscriptWord]] = []
+    current: list[TranscriptWord] = []
+    for word in words:
+        if current and (
+            word.start - current[-1].end > CaptionSegmenter.PAUSE_THRESHOLD
+            or len(current) >= max_words
+            or current[-1].text.strip().endswith((".", "!", "?"))
+        ):
+            phrases.append(current)
+            current = []
+        current.append(word)
+    if current:
+        phrases.append(current)
+
+    merged = []
+    i = 0
+    while i < len(phrases):
+        if (
+            len(phrases[i]) < min_words
+            and i + 1 < len(phrases)
+            and len(phrases[i]) + len(phrases[i + 1]) <= max_words + 1
+        ):
+            merged.append(phrases[i] + phrases[i + 1])
+            i += 2
+        else:
+            merged.append(phrases[i])
+            i += 1
+    return merged
+
+
+def group(text: str, max_words: int = 4, min_words: int = 2) -> list[str]:
+    segmenter = CaptionSegmenter(
+        max_words_per_caption=max_words, min_words_per_caption=min_words
+    )
+    phrases = segmenter._group_into_phrases(make_words(text), max_words)
+    return [" ".join(w.text for w in phrase) for phrase in phrases]
+
+
+@pytest.mark.parametrize(
+    ("text", "max_words", "expected"),
+    [
+        ("", 4, []),
+        ("one two three four five six", 4, ["one two three four", "five six"]),
+        ("one two | three four", 4, ["one two", "three four"]),
+        ("Hi. there you go", 4, ["Hi. there you go"]),
+        ("a. b. c. d.", 4, ["a. b.", "c. d."]),
+        ("a. b. c.", 4, ["a. b.", "c."]),
+        # A short phrase at the end has nothing to merge with
+        ("one two three four. five", 4, ["one two three four.", "five"]),
+        ("a b c d", 1, ["a b", "c d"]),
+        ("a b c", 0, ["a", "b", "c"]),
+    ],
+)
+def test_group_into_phrases(text, max_words, expected):
+    assert group(text, max_words) == expected
+
+
+def test_group_into_phrases_matches_reference_on_random_words():
+    rng = random.Random(0)
+    vocab = ["and", "hello", "world.", "yes!", "really?", "wow,", "x...", "so"]
+    for _ in range(2000):
+        words = []
+        t = 0.0
+        for _ in range(rng.randint(0, 40)):
+            t += rng.choice([0.0, 0.1, 0.3, 0.6, 1.0])
+            duration = rng.uniform(0.05, 0.5)
+            words.append(
+                TranscriptWord(text=rng.choice(vocab), start=t, end=t + duration)
+            )
+            t += duration
+        max_words = rng.randint(0, 6)
+        min_words = rng.randint(1, 4)
+        segmenter = CaptionSegmenter(min_words_per_caption=min_words)
+
+        assert segmenter._group_into_phrases(words, max_words) == reference_phrases(
+            words, max_words, min_words
+        )
+
+
+def test_segment_max_words_applies_to_one_call_only():
+    segmenter = CaptionSegmenter(max_words_per_caption=4)
+    transcript = Transcript(words=make_words("a b c d e f g h"), duration=4.0)
+
+    captions = segmenter.segment(transcript, max_words=2)
+
+    assert [c.text for c in captions] == ["a b", "c d", "e f", "g h"]
+    assert segmenter.max_words == 4
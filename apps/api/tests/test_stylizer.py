@@ -0,0 +1,40 @@
+"""Tests for caption stylization."""
+
+import pytest
+
+from src.captions.stylizer import CaptionStylizer
+from src.models import Caption, CaptionWord
+
+
+def make_caption(text: str) -> Caption:
+    words = [
+        CaptionWord(text=word, start=i * 0.5, end=i * 0.5 + 0.4)
+        for i, word in enumerate(text.split())
+    ]
+    return Caption(id="caption_0", text=text, start=0.0, end=words[-1].end, words=words)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("it's what I'm doing", ["doing"]),
+        ("it’s what I’m doing", ["doing"]),
+        ("don’t you know", ["know"]),
+        ("they’re gonna shine", ["shine"]),
+    ],
+)
+def test_lexical_emphasis_skips_stopwords_with_curly_punctuation(text, expected):
+    captions = CaptionStylizer().stylize([make_caption(text)])
+
+    assert captions.captions[0].emphasis == expected
+
+
+def test_stylize_results_do_not_share_settings():
+    stylizer = CaptionStylizer()
+    first = stylizer.stylize([make_caption("hello there world")])
+    second = stylizer.stylize([make_caption("hello there world")])
+
+    first.settings.fontSize = 99
+
+    assert second.settings.fontSize != 99
+    assert stylizer.stylize([]).settings.fontSize != 99
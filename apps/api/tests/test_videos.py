@@ -0,0 +1,67 @@
+"""Tests for stored video lookup."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src import main
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "VIDEO_STORAGE_DIR", tmp_path)
+    monkeypatch.setattr(main, "_video_index", {})
+    return tmp_path
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def test_get_video_from_index(storage, client):
+    path = storage / "indexed.mp4"
+    path.write_bytes(b"video")
+    main._video_index["indexed"] = path
+
+    response = client.get("/api/videos/indexed")
+
+    assert response.status_code == 200
+    assert response.content == b"video"
+    assert response.headers["content-type"] == "video/mp4"
+
+
+def test_get_video_not_in_index_probes_storage(storage, client):
+    # Uploaded by another worker, or after this worker started
+    (storage / "other-worker_1.webm").write_bytes(b"video")
+
+    response = client.get("/api/videos/other-worker_1")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "video/webm"
+    assert main._video_index["other-worker_1"] == storage / "other-worker_1.webm"
+
+
+def test_delete_video_not_in_index(storage, client):
+    path = storage / "abc.mov"
+    path.write_bytes(b"video")
+
+    response = client.delete("/api/videos/abc")
+
+    assert response.status_code == 200
+    assert not path.exists()
+    assert "abc" not in main._video_index
+
+
+@pytest.mark.parametrize("video_id", ["missing", "bad.id", "..%2Fsecret"])
+def test_unknown_video_is_404(storage, client, video_id):
+    (storage.parent / "secret.mp4").write_bytes(b"video")
+
+    assert client.get(f"/api/videos/{video_id}").status_code == 404
+    assert client.delete(f"/api/videos/{video_id}").status_code == 404
+
+
+def test_stale_index_entry_is_404(storage, client):
+    main._video_index["gone"] = storage / "gone.mp4"
+
+    assert client.get("/api/videos/gone").status_code == 404
+    assert "gone" not in main._video_index
@@ -0,0 +1,223 @@
+"""Tests for Whisper transcription post-processing."""
+
+import random
+
+import pytest
+
+from src.transcription.whisper_service import (
+    WhisperService,
+    _RawTranscript,
+    _WordColumns,
+)
+
+
+def make_columns(timings: list[tuple[float, float]]) -> _WordColumns:
+    return _WordColumns(
+        texts=[f"w{i}" for i in range(len(timings))],
+        starts=[start for start, _ in timings],
+        ends=[end for _, end in timings],
+        confidences=[None] * len(timings),
+    )
+
+
+def reference_normalize(
+    timings: list[tuple[float, float]],
+) -> list[tuple[float, float]]:
+    """Straightforward per-word version of WhisperService timing rules."""
+    normalized = []
+    prev_end = 0.0
+    for start, end in timings:
+        if start < prev_end and start - prev_end > -WhisperService.MAX_SNAP_OVERLAP:
+            start = prev_end
+        if end <= start:
+            end = start + WhisperService.INVALID_WORD_DURATION
+        if end - start < WhisperService.MIN_WORD_DURATION:
+            end = start + WhisperService.MIN_WORD_DURATION
+        normalized.append((start, end))
+        prev_end = end
+    return normalized
+
+
+def normalize(timings: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    columns = WhisperService()._normalize_word_timings(make_columns(timings))
+    return list(zip(columns.starts, columns.ends, strict=True))
+
+
+def flatten(timings: list[tuple[float, float]]) -> list[float]:
+    return [t for timing in timings for t in timing]
+
+
+def test_normalize_empty():
+    assert normalize([]) == []
+
+
+def test_normalize_leaves_valid_timings_alone():
+    timings = [(0.0, 0.4), (0.4, 0.9), (1.5, 2.0)]
+
+    assert normalize(timings) == timings
+
+
+def test_normalize_overlap_of_exactly_max_snap_is_kept():
+    # 0.0 - 0.1 == -0.1 exactly: not a "small" overlap, so start is kept
+    assert normalize([(0.0, 0.1), (0.0, 0.5)]) == [(0.0, 0.1), (0.0, 0.5)]
+
+
+def test_normalize_small_overlap_snaps_to_previous_end():
+    assert normalize([(0.0, 0.1), (0.01, 0.5)]) == [(0.0, 0.1), (0.1, 0.5)]
+
+
+def test_normalize_end_before_start_after_snap():
+    result = normalize([(0.0, 1.0), (0.95, 0.98)])
+
+    assert result[1] == pytest.approx((1.0, 1.05))
+
+
+def test_normalize_minimum_duration():
+    result = normalize([(2.0, 2.01)])
+
+    assert result[0] == pytest.approx((2.0, 2.03))
+
+
+def test_normalize_chain_of_pushed_ends():
+    # Each zero-length word is pushed past the previous one, and the last
+    # word (valid against the original timings) is pulled along too
+    timings = [(1.0, 1.0), (1.0, 1.0), (1.04, 1.04), (1.08, 1.1), (1.12, 1.5)]
+
+    result = normalize(timings)
+
+    assert flatten(result) == pytest.approx(
+        flatten([(1.0, 1.05), (1.05, 1.1), (1.1, 1.15), (1.15, 1.2), (1.2, 1.5)])
+    )
+    assert result == reference_normalize(timings)
+
+
+def test_normalize_matches_reference_on_random_timings():
+    rng = random.Random(0)
+    for _ in range(2000):
+        timings = []
+        t = 0.0
+        for _ in range(rng.randint(1, 30)):
+            start = max(0.0, t + rng.choice([-0.2, -0.1, -0.05, 0.0, 0.01, 0.3]))
+            end = max(0.0, start + rng.choice([-0.1, 0.0, 0.01, 0.02, 0.2, 0.5]))
+            timings.append((start, end))
+            t = max(t, end)
+
+        assert normalize(timings) == reference_normalize(timings), timings
+
+
+class FakeBackend:
+    """Stands in for audio decoding and model inference."""
+
+    def __init__(self, service: WhisperService, monkeypatch: pytest.MonkeyPatch):
+        self.runs: list[str | None] = []
+        monkeypatch.setattr(service, "_load_audio", lambda path: path.read_bytes())
+        monkeypatch.setattr(service, "_run_openai_whisper", self.run)
+        monkeypatch.setattr(service, "_run_faster_whisper", self.run)
+
+    def run(self, audio: bytes, language: str | None) -> _RawTranscript:
+        self.runs.append(language)
+        return _RawTranscript(
+            columns=make_columns([(0.0, 0.5)]),
+            text=audio.decode(),
+            duration=0.5,
+            language=language or "en",
+        )
+
+
+@pytest.fixture
+def service():
+    return WhisperService()
+
+
+@pytest.fixture
+def backend(service, monkeypatch):
+    return FakeBackend(service, monkeypatch)
+
+
+def write_audio(tmp_path, name: str, content: str):
+    path = tmp_path / name
+    path.write_text(content)
+    return path
+
+
+def test_transcribe_missing_file(service, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        service.transcribe(tmp_path / "missing.wav")
+
+
+def test_transcribe_cache_hit_for_same_content_at_another_path(
+    service, backend, tmp_path
+):
+    first = service.transcribe(write_audio(tmp_path, "a.wav", "audio"))
+    second = service.transcribe(write_audio(tmp_path, "b.wav", "audio"))
+
+    assert second is first
+    assert backend.runs == [None]
+
+
+def test_transcribe_cache_key_includes_content_language_and_model(
+    service, backend, tmp_path
+):
+    path = write_audio(tmp_path, "a.wav", "audio")
+    service.transcribe(path)
+    service.transcribe(path, language="fr")
+    service.transcribe(write_audio(tmp_path, "b.wav", "other audio"))
+    service.model_name = "tiny"
+    service.transcribe(path)
+
+    assert backend.runs == [None, "fr", None, None]
+
+
+def test_transcribe_cache_evicts_least_recently_used(
+    service, backend, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(service, "TRANSCRIPT_CACHE_SIZE", 2)
+    a = write_audio(tmp_path, "a.wav", "a")
+    b = write_audio(tmp_path, "b.wav", "b")
+    c = write_audio(tmp_path, "c.wav", "c")
+
+    for path in (a, b, a, c):  # a is reused, so c evicts b
+        service.transcribe(path)
+    assert len(backend.runs) == 3
+
+    service.transcribe(a)
+    assert len(backend.runs) == 3
+
+    service.transcribe(b)
+    assert len(backend.runs) == 4
+
+
+def test_default_backend():
+    assert WhisperService().backend == "openai-whisper"
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError, match="Invalid backend: nope"):
+        WhisperService(backend="nope")
+
+
+@pytest.mark.parametrize(
+    ("backend_name", "method"),
+    [
+        ("openai-whisper", "_run_openai_whisper"),
+        ("faster-whisper", "_run_faster_whisper"),
+    ],
+)
+def test_transcribe_uses_selected_backend(backend_name, method, tmp_path, monkeypatch):
+    service = WhisperService(backend=backend_name)
+    used = []
+
+    def fake_run(name):
+        def run(audio, language):
+            used.append(name)
+            return _RawTranscript(make_columns([]), "", 0.0, "en")
+
+        return run
+
+    monkeypatch.setattr(service, "_load_audio", lambda path: b"")
+    monkeypatch.setattr(service, "_run_openai_whisper", fake_run("_run_openai_whisper"))
+    monkeypatch.setattr(service, "_run_faster_whisper", fake_run("_run_faster_whisper"))
+
+    service.transcribe(write_audio(tmp_path, "a.wav", "audio"))
+
+    assert used == [method]